@@ -23,38 +23,138 @@ Last modified: 12 December 2018
 Author: James K. Pringle
 E-mail: jpringle@jhu.edu
 """
-import argparse
+import concurrent.futures
+import functools
+import os
 import pathlib
-from typing import List, Set
+import stat
+from typing import List, Set, Tuple
 
 from pmix.verbiage import TranslationDict
 from pmix import Xlsform
 
 
+def file_signature(realpath: str) -> Tuple[str, int, int]:
+    """Get a signature identifying the current contents of a file.
+
+    Args:
+        realpath: The canonical path (os.path.realpath) of the file
+
+    Returns:
+        A tuple of the path, its mtime in nanoseconds, and its size.
+        The signature changes whenever the file is rewritten, so caches
+        keyed on it are invalidated by edits to the file.
+    """
+    stat_result = os.stat(realpath)
+    return realpath, stat_result.st_mtime_ns, stat_result.st_size
+
+
+@functools.lru_cache(maxsize=None)
+def cached_xlsform(signature: Tuple[str, int, int]) -> Xlsform:
+    """Get an Xlsform, parsing its file at most once per process.
+
+    Repeated `borrow` calls in the same process reuse parsed workbooks
+    rather than unzipping and parsing the same .xlsx again. A file that
+    has changed on disk gets a new signature and is parsed afresh.
+
+    Args:
+        signature: A file signature from `file_signature`
+
+    Returns:
+        The parsed Xlsform for that file
+    """
+    return Xlsform(signature[0], read_only=True)
+
+
+# Cache of extracted translations, keyed by the signatures of all
+# source files together with their correct markings
+_translation_dict_cache = {}
+
+
+def extract_translation_dict(
+    job: Tuple[Tuple[str, int, int], bool]
+) -> TranslationDict:
+    """Extract a translation dict from a single source file.
+
+    This is the unit of work for parallel extraction. It is a
+    module-level function so that it can be pickled for worker processes.
+
+    Args:
+        job: A tuple of the source file signature and whether the file
+            is marked correct
+
+    Returns:
+        A TranslationDict with the translations from that one file
+    """
+    signature, correct = job
+    translation_dict = TranslationDict()
+    translation_dict.extract_translations(
+        cached_xlsform(signature), correct=correct
+    )
+    return translation_dict
+
+
 def create_translation_dict(xlsxfile: List[str], correct: List[str]) -> TranslationDict:
     """Create a translation dict from source Excel files.
 
+    Each distinct file is parsed at most once, even if it is listed
+    multiple times or appears in both `correct` and `xlsxfile`. When
+    there are multiple files to parse, the parsing fans out to worker
+    processes, one file per job, and the per-file results are merged
+    in order, correct files first.
+
+    The combined result is cached on the ordered signatures of all
+    input files, so repeated calls with unchanged inputs skip
+    extraction entirely. Editing or reordering any input file
+    invalidates the cached result; ordering matters because it drives
+    how ties between repeated translations are broken.
+
     Args:
         xlsxfile: Paths to Excel files
         correct: Paths to Excel files that should be marked correct
     """
+    correct_files = dict.fromkeys(os.path.realpath(path) for path in correct)
+    source_files = dict.fromkeys(os.path.realpath(path) for path in xlsxfile)
+    jobs = [(file_signature(path), True) for path in correct_files]
+    jobs.extend(
+        (file_signature(path), False)
+        for path in source_files
+        if path not in correct_files
+    )
+    cache_key = tuple(jobs)
+    if cache_key in _translation_dict_cache:
+        return _translation_dict_cache[cache_key]
     translation_dict = TranslationDict()
-    extracted = set()
-    for path in correct:
-        if path in extracted:
-            continue
-        xlsform = Xlsform(path)
-        translation_dict.extract_translations(xlsform, correct=True)
-        extracted.add(path)
-    for path in xlsxfile:
-        if path in extracted:
-            continue
-        xlsform = Xlsform(path)
-        translation_dict.extract_translations(xlsform)
-        extracted.add(path)
+    if len(jobs) > 1 and (os.cpu_count() or 1) > 1:
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            for partial in executor.map(extract_translation_dict, jobs):
+                translation_dict.merge(partial)
+    else:
+        for signature, flag in jobs:
+            xlsform = cached_xlsform(signature)
+            translation_dict.extract_translations(xlsform, correct=flag)
+    _translation_dict_cache[cache_key] = translation_dict
     return translation_dict
 
 
+def stat_mode(path: pathlib.Path) -> int:
+    """Get the stat mode for a path, or 0 if the path does not exist.
+
+    A single stat call answers both "is it a file?" and "is it a
+    directory?" for a given path.
+
+    Args:
+        path: The path to examine
+
+    Returns:
+        The st_mode of the path, or 0 for a missing path
+    """
+    try:
+        return path.stat().st_mode
+    except OSError:
+        return 0
+
+
 def get_translation_file_path(
     *, outfile: str = None, outdir: str = None, create_parents: bool = True
 ) -> str:
@@ -73,17 +173,21 @@ def get_translation_file_path(
     result_path = default_directory / default_filename
     if outfile:
         specific_path = pathlib.Path(outfile)
-        if specific_path.is_dir():
+        if stat.S_ISDIR(stat_mode(specific_path)):
             msg = f"Cannot use outfile {outfile} as a file. It is a directory!"
             raise IOError(msg)
         result_path = specific_path
     elif outdir:
         specific_path = pathlib.Path(outdir)
-        if specific_path.is_file():
+        if create_parents:
+            try:
+                specific_path.mkdir(parents=True, exist_ok=True)
+            except (FileExistsError, NotADirectoryError) as err:
+                msg = f"Cannot use outdir {outdir} as directory. It is a file!"
+                raise IOError(msg) from err
+        elif stat.S_ISREG(stat_mode(specific_path)):
             msg = f"Cannot use outdir {outdir} as directory. It is a file!"
             raise IOError(msg)
-        if not specific_path.is_dir() and create_parents:
-            specific_path.mkdir(parents=True, exist_ok=True)
         result_path = specific_path / default_filename
     return str(result_path)
 
@@ -130,11 +234,15 @@ def get_merged_file_paths(
     result_directory = default_directory
     if outdir:
         result_directory = pathlib.Path(outdir)
-        if result_directory.is_file():
+        if create_parents:
+            try:
+                result_directory.mkdir(parents=True, exist_ok=True)
+            except (FileExistsError, NotADirectoryError) as err:
+                msg = f"Cannot use outdir {outdir} as directory. It is a file!"
+                raise IOError(msg) from err
+        elif stat.S_ISREG(stat_mode(result_directory)):
             msg = f"Cannot use outdir {outdir} as directory. It is a file!"
             raise IOError(msg)
-        if create_parents:
-            result_directory.mkdir(parents=True, exist_ok=True)
     default_suffix = "-borrow"
     for merge_file in merge:
         this_merge = pathlib.Path(merge_file)
@@ -144,6 +252,28 @@ def get_merged_file_paths(
     return file_paths
 
 
+def merge_single_translation_file(job) -> None:
+    """Merge translations into a single ODK file and write it out.
+
+    This is the unit of work for parallel merging. It is a module-level
+    function so that it can be pickled for worker processes.
+
+    Args:
+        job: A tuple of (merge_source, merge_destination,
+            translation_dict, add, ignore, carry, no_diverse). See
+            `merge_translation_file` for their meanings.
+    """
+    merge_source, merge_destination, translation_dict = job[:3]
+    add, ignore, carry, no_diverse = job[3:]
+    xlsform = Xlsform(merge_source)
+    xlsform.add_languages(add)
+    xlsform.merge_translations(
+        translation_dict, ignore, carry=carry, no_diverse=no_diverse
+    )
+    xlsform.write_out(merge_destination)
+    print('Merged translations into file: "{}"'.format(merge_destination))
+
+
 # pylint: disable=too-many-arguments
 def merge_translation_file(
     merge: List[str],
@@ -153,9 +283,13 @@ def merge_translation_file(
     ignore: Set[str],
     carry: bool,
     no_diverse: bool,
+    jobs: int = 1,
 ):
     """Merge in translations to designated ODK files.
 
+    Each file is an independent load + merge + write, so with jobs > 1
+    the files fan out to that many worker processes.
+
     Args:
         merge: The files to merge into
         translation_dict: The object with translation information
@@ -166,19 +300,38 @@ def merge_translation_file(
         carry: If true, carry text from the source language to the translations
         no_diverse: If true, do not insert a translation that has various
             choices
+        jobs: How many worker processes to use. Defaults to 1 for
+            sequential merging.
     """
-    for merge_source, merge_destination in zip(merge, outfile):
-        xlsform = Xlsform(merge_source)
-        xlsform.add_languages(add)
-        xlsform.merge_translations(
-            translation_dict, ignore, carry=carry, no_diverse=no_diverse
+    work = [
+        (
+            merge_source,
+            merge_destination,
+            translation_dict,
+            add,
+            ignore,
+            carry,
+            no_diverse,
         )
-        xlsform.write_out(merge_destination)
-        print('Merged translations into file: "{}"'.format(merge_destination))
+        for merge_source, merge_destination in zip(merge, outfile)
+    ]
+    if jobs > 1 and len(work) > 1:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs
+        ) as executor:
+            # Consume the iterator so worker exceptions propagate
+            list(executor.map(merge_single_translation_file, work))
+    else:
+        for job in work:
+            merge_single_translation_file(job)
 
 
 def borrow_cli():
     """Run the CLI for this module."""
+    # Imported here so that programmatic users of borrow() do not pay
+    # for argparse at module import time.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Grab translations from existing XLSForms"
     )
@@ -263,6 +416,16 @@ def borrow_cli():
             "the source language. The default is to leave missing."
         ),
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "How many worker processes to use when merging into multiple "
+            "files. Defaults to 1 for sequential merging."
+        ),
+    )
     parser.add_argument(
         "-o",
         "--outfile",
@@ -297,6 +460,7 @@ def borrow_cli():
         carry=args.carry,
         outfile=args.outfile,
         outdir=args.outdir,
+        jobs=args.jobs,
     )
 
 
@@ -314,6 +478,7 @@ def borrow(
     carry: bool = False,
     outfile: str = None,
     outdir: str = None,
+    jobs: int = 1,
 ):
     """Borrow files with this Python routine.
 
@@ -333,11 +498,33 @@ def borrow(
             exists
         outfile: Filename where to write the result
         outdir: Directory where to write the result
+        jobs: How many worker processes to use when merging into
+            multiple files
     """
     source_files = xlsxfiles
     correct_files = correct if correct else []
+    single_source = (
+        len(source_files) == 1
+        and not correct_files
+        and not merge
+        and not merge_all
+        and not add
+        and not diverse
+    )
+    if single_source:
+        # Fast path for the common case: one source file straight to a
+        # translation file, skipping the multi-file plumbing.
+        translation_dict = TranslationDict()
+        realpath = os.path.realpath(source_files[0])
+        xlsform = cached_xlsform(file_signature(realpath))
+        translation_dict.extract_translations(xlsform)
+        outfile = get_translation_file_path(
+            outfile=outfile, outdir=outdir, create_parents=True
+        )
+        write_translation_file(translation_dict, outfile, [], diverse)
+        return
     translation_dict = create_translation_dict(source_files, correct_files)
-    to_add = sorted(list(set(add))) if add else []
+    to_add = sorted(set(add)) if add else []
     if not merge and not merge_all:
         outfile = get_translation_file_path(
             outfile=outfile, outdir=outdir, create_parents=True
@@ -361,6 +548,7 @@ def borrow(
             ignored,
             carry,
             no_diverse,
+            jobs=jobs,
         )
 
 
@@ -26,29 +26,62 @@ class RenumberMap:
         extension = os.path.splitext(filename)[1]
         if extension in (".xls", ".xlsx"):
             self.map = self.map_from_excel(self.filename)
-        self.regex_map = {key: re.compile(r"\b{}\b".format(key)) for key in self.map}
+        self.combined_program = None
+        self.key_by_group = ()
+        if self.map:
+            # One alternation over all keys, longest first so that
+            # overlapping keys match their longest form. Each key gets
+            # its own named group, so a match maps back to its rule
+            # through `lastgroup` rather than by re-escaping the
+            # matched text.
+            ordered = sorted(self.map, key=len, reverse=True)
+            pattern = r"\b(?:{})\b".format(
+                "|".join(
+                    "(?P<k{}>{})".format(i, key)
+                    for i, key in enumerate(ordered)
+                )
+            )
+            self.combined_program = re.compile(pattern)
+            self.key_by_group = ordered
 
     def applies_to(self, value):
         """Return all the rules that apply to a particular text."""
-        if not isinstance(value, str):
+        if not isinstance(value, str) or self.combined_program is None:
             return []
-        keys = []
-        for key, program in self.regex_map.items():
-            if program.search(value):
-                keys.append(key)
-        return keys
-
-    def apply(self, value, keys) -> str:
-        """Apply a rule to a text."""
-        if not isinstance(value, str):
+        return list(
+            dict.fromkeys(
+                self.key_by_group[int(match.lastgroup[1:])]
+                for match in self.combined_program.finditer(value)
+            )
+        )
+
+    def applies_to_any(self, values) -> bool:
+        """Test whether any rule applies to any of the given values.
+
+        The string values are joined and scanned with one regex search,
+        making this a cheap pre-filter for a row of cells before the
+        per-cell work.
+        """
+        if self.combined_program is None:
+            return False
+        joined = "\x00".join(
+            value for value in values if isinstance(value, str)
+        )
+        return bool(self.combined_program.search(joined))
+
+    def apply(self, value) -> str:
+        """Apply all applicable rules to a text.
+
+        Each occurrence of a rule's source is replaced in a single pass,
+        so replacement text is never itself rescanned for further rules.
+        """
+        if not isinstance(value, str) or self.combined_program is None:
             return value
-        updated_value = value
-        placeholders = [f"yQQQy{self.map[key]}yQQQy" for key in keys]
-        for key, placeholder in zip(keys, placeholders):
-            program = self.regex_map[key]
-            updated_value = program.sub(placeholder, updated_value)
-        updated_value = re.sub("yQQQy", "", updated_value)
-        return updated_value
+        keys = self.key_by_group
+        return self.combined_program.sub(
+            lambda match: self.map[keys[int(match.lastgroup[1:])]],
+            value,
+        )
 
     @staticmethod
     def map_from_excel(filename):
@@ -56,6 +89,7 @@ class RenumberMap:
         not_enough_columns = False
         logging.info(f"Loading data from {filename}")
         renumbering = {}
+        seen_finishes = set()
         workbook = Workbook(filename)
         worksheet = workbook[0]
         for i, row in enumerate(worksheet):
@@ -68,7 +102,7 @@ class RenumberMap:
                     if start_escaped in renumbering:
                         msg = f'Duplicate renaming source found: row {i+1}, "{start}"'
                         logging.info(msg)
-                    if finish in renumbering.values():
+                    if finish in seen_finishes:
                         msg = (
                             f"Duplicate renaming replacement found: "
                             f'row {i+1}, "{start}"'
@@ -87,6 +121,7 @@ class RenumberMap:
                         )
                         logging.info(msg)
                     renumbering[start_escaped] = finish
+                    seen_finishes.add(finish)
                 else:
                     msg = (
                         f'Row {i+1} "{start}" -> "{finish}" skipped since it is not'
@@ -123,10 +158,7 @@ def check_label_numbers_match(xlsform: Xlsform) -> bool:
     for i, row in enumerate(survey):
         if i == 0:
             continue
-        these_labels = (row[j] for j in labels)
-        components = (split_numbered_text(str(cell)) for cell in these_labels)
-        numbers = (item.number for item in components)
-        distinct = set(numbers)
+        distinct = {split_numbered_text(str(row[j])).number for j in labels}
         if len(distinct) > 1:
             logging.warning(
                 f"Different question numbers found in labels of "
@@ -155,6 +187,10 @@ def do_renumber(xlsform_path, renumbering_path, dry_run=False, all_columns=False
     for i, row in enumerate(survey):
         if i == 0:
             continue
+        # Most rows contain no renumberable token: skip them with one
+        # scan over the row instead of one per cell.
+        if not renumbering.applies_to_any(row[j].value for j in columns):
+            continue
         for j in columns:
             value = row[j].value
             applications = renumbering.applies_to(value)
@@ -171,9 +207,9 @@ def do_renumber(xlsform_path, renumbering_path, dry_run=False, all_columns=False
             f"in XLSForm: {missing}, count: {len(missing)}"
         )
     change_count = 0
-    for cell, applications in cell_applications:
+    for cell, _ in cell_applications:
         old_value = cell.value
-        new_value = renumbering.apply(old_value, applications)
+        new_value = renumbering.apply(old_value)
         if not dry_run:
             cell.value = new_value
         if old_value != new_value:
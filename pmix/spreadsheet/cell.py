@@ -1,5 +1,7 @@
 """Module for Cell class."""
 import datetime
+import functools
+import sys
 
 import xlrd
 from xlsxwriter.utility import xl_rowcol_to_cell
@@ -16,6 +18,10 @@ class CellContext:
         row: The
     """
 
+    __slots__ = ("filename", "sheet", "row", "column", "column_header")
+
+    _placeholder = None
+
     def __init__(
         self, filename: str, sheet: str, row: int, column: int, column_header: str
     ):
@@ -34,11 +40,16 @@ class CellContext:
 
     @classmethod
     def empty_context(cls):
-        """Create an empty context.
+        """Get the shared empty context.
 
-        This is meant to be a place holder until later.
+        This is meant to be a place holder until later. Placeholder
+        contexts are only ever replaced wholesale, never modified in
+        place, so every cell shares one instance instead of allocating
+        its own.
         """
-        return cls(None, None, -1, -1, None)
+        if cls._placeholder is None:
+            cls._placeholder = cls(None, None, -1, -1, None)
+        return cls._placeholder
 
     def __repr__(self):
         """Get a representation of this object."""
@@ -57,6 +68,8 @@ class CellError:
         error_text (str): The display text of the error
     """
 
+    __slots__ = ("value", "error_text")
+
     def __init__(self, value):
         """Initialize with a specific internal error value.
 
@@ -87,16 +100,30 @@ class Cell:
         highlight (str): The highlight color for this cell.
     """
 
+    __slots__ = ("_value", "highlight", "context", "_str")
+
     def __init__(self, value=None, *, context: CellContext = None):
         """Initialize cell to have value as Python object.
 
         Args:
             value: The value of the cell. Defaults to None for a blank cell.
         """
-        self.value = value
+        self._value = value
+        self._str = None
         self.highlight = None
         self.context = context if context else CellContext.empty_context()
 
+    @property
+    def value(self):
+        """Get the value of the cell."""
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        """Set the value of the cell and drop the cached string."""
+        self._value = value
+        self._str = None
+
     def is_blank(self):
         """Test whether cell is blank."""
         return str(self) == ""
@@ -141,10 +168,14 @@ class Cell:
         return False
 
     def __str__(self):
-        """Return unicode representation of cell."""
-        if self.value is None:
-            return ""
-        return str(self.value)
+        """Return unicode representation of cell.
+
+        The string is computed once per value and cached, since cells
+        are converted repeatedly during comparisons and translation.
+        """
+        if self._str is None:
+            self._str = "" if self._value is None else str(self._value)
+        return self._str
 
     def __repr__(self):
         """Return a representation of the cell."""
@@ -166,10 +197,44 @@ class Cell:
         cell_value = cls.cell_value(cell, datemode, stripstr)
         return cls(cell_value)
 
+    @classmethod
+    def from_openpyxl_cell(cls, cell, stripstr=True):
+        """Create a Cell object by importing a cell from openpyxl.
+
+        openpyxl delivers values already typed as Python objects, so
+        only text cleanup, error mapping, and date normalization
+        remain. Dates normalize the same way as `parse_datetime` so
+        that both readers produce identical cells.
+
+        Args:
+            cell: An openpyxl read-only cell to copy over.
+            stripstr (bool): Remove trailing / leading whitespace from text?
+
+        Returns:
+            An intialized cell object.
+        """
+        value = cell.value
+        if isinstance(value, str):
+            if cell.data_type == "e":
+                code = _ERROR_CODE_FROM_TEXT.get(value, _NA_ERROR_CODE)
+                value = CellError(code)
+            else:
+                value = _clean_text(value, stripstr)
+        elif isinstance(value, float):
+            value = int(value) if value.is_integer() else value
+        elif isinstance(value, datetime.datetime):
+            if value.time() == datetime.time.min:
+                # date-only cells arrive as midnight datetimes
+                value = value.date()
+        return cls(value)
+
     @staticmethod
     def cell_value(cell, datemode=None, stripstr=True):
         """Get python object out of xlrd.Cell value.
 
+        The cell type dispatches through a handler table rather than a
+        chain of comparisons, since this runs once per loaded cell.
+
         Args:
             cell (xlrd.Cell): The cell
             datemode (int): The date mode for the workbook
@@ -178,35 +243,20 @@ class Cell:
         Returns:
             value (str): The python object represented by this cell.
         """
-        value = None
-        if cell.ctype == xlrd.XL_CELL_BOOLEAN:
-            value = True if cell.value == 1 else False
-        elif cell.ctype == xlrd.XL_CELL_EMPTY:
-            # value = None  # ... redundant
-            pass
-        elif cell.ctype == xlrd.XL_CELL_TEXT:
-            if stripstr:
-                value = cell.value.strip()
-            else:
-                value = cell.value
-        elif cell.ctype == xlrd.XL_CELL_NUMBER:
-            # Make integer what is equal to an integer
-            int_val = int(cell.value)
-            value = int_val if int_val == cell.value else cell.value
-        elif cell.ctype == xlrd.XL_CELL_DATE:
-            value = Cell.parse_datetime(cell.value, datemode)
-        elif cell.ctype == xlrd.XL_CELL_ERROR:
-            value = CellError(cell.value)
-        else:
+        handler = _CELL_VALUE_HANDLERS.get(cell.ctype)
+        if handler is None:
             msg = "Unhandled cell found!\nType: {}\nValue: {}"
             msg = msg.format(cell.ctype, cell.value)
             raise TypeError(msg)
-        return value
+        return handler(cell, datemode, stripstr)
 
     @staticmethod
     def parse_datetime(value, datemode):
         """Convert an xlrd cell value to a date time object.
 
+        Date values repeat often within a workbook, so results are
+        cached on (value, datemode).
+
         Args:
             value: The cell value
             datemode (int): The date mode of the Excel workbook
@@ -214,13 +264,105 @@ class Cell:
         if datemode is None:
             # set to modern Excel
             datemode = 1
-        date_tuple = xlrd.xldate_as_tuple(value, datemode)
-        if date_tuple[:3] == (0, 0, 0):
-            # must be time only
-            value = datetime.time(*date_tuple[3:])
-        elif date_tuple[3:] == (0, 0, 0):
-            # must be date only
-            value = datetime.date(*date_tuple[:3])
-        else:
-            value = datetime.datetime(*date_tuple)
-        return value
+        return _parse_datetime(value, datemode)
+
+
+# Proleptic Gregorian ordinal of day zero for each Excel date mode
+_EXCEL_EPOCH_ORDINAL = {
+    0: datetime.date(1899, 12, 30).toordinal(),
+    1: datetime.date(1904, 1, 1).toordinal(),
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime(value, datemode):
+    """Convert an Excel date value into a time, date, or datetime.
+
+    The Excel serial maps directly onto a proleptic Gregorian ordinal,
+    so the date comes from integer arithmetic rather than the calendar
+    arithmetic in xlrd's `xldate_as_tuple`.
+    """
+    days, frac = divmod(value, 1)
+    seconds = round(frac * 86400)
+    if days == 0:
+        # must be time only
+        as_datetime = datetime.datetime.min + datetime.timedelta(
+            seconds=seconds
+        )
+        return as_datetime.time()
+    if datemode == 0 and days < 61:
+        # Excel's 1900 leap-year bug makes these serials ambiguous
+        raise xlrd.xldate.XLDateAmbiguous(value)
+    day = datetime.date.fromordinal(_EXCEL_EPOCH_ORDINAL[datemode] + int(days))
+    if seconds == 0:
+        # must be date only
+        return day
+    base = datetime.datetime.combine(day, datetime.time())
+    return base + datetime.timedelta(seconds=seconds)
+
+
+def _clean_text(value, stripstr):
+    """Clean up a text value from a spreadsheet.
+
+    Short strings are interned: spreadsheets repeat the same short
+    values (choice names, types, language text) across thousands of
+    cells, and interning collapses the copies into one shared object.
+    """
+    if stripstr:
+        value = value.strip()
+    if len(value) < 64:
+        value = sys.intern(value)
+    return value
+
+
+def _cell_value_text(cell, datemode, stripstr):
+    """Get the value of a text cell."""
+    return _clean_text(cell.value, stripstr)
+
+
+def _cell_value_number(cell, datemode, stripstr):
+    """Get the value of a number cell.
+
+    Makes integer what is equal to an integer.
+    """
+    value = cell.value
+    return int(value) if value.is_integer() else value
+
+
+def _cell_value_empty(cell, datemode, stripstr):
+    """Get the value of an empty cell."""
+    return None
+
+
+def _cell_value_boolean(cell, datemode, stripstr):
+    """Get the value of a boolean cell."""
+    return cell.value == 1
+
+
+def _cell_value_date(cell, datemode, stripstr):
+    """Get the value of a date cell."""
+    return Cell.parse_datetime(cell.value, datemode)
+
+
+def _cell_value_error(cell, datemode, stripstr):
+    """Get the value of an error cell."""
+    return CellError(cell.value)
+
+
+# Excel internal error codes by display text, for readers such as
+# openpyxl that report errors as text. #N/A is the fallback.
+_ERROR_CODE_FROM_TEXT = {
+    text: code for code, text in xlrd.error_text_from_code.items()
+}
+_NA_ERROR_CODE = 0x2A
+
+
+# Handlers for Cell.cell_value, most common cell types first
+_CELL_VALUE_HANDLERS = {
+    xlrd.XL_CELL_TEXT: _cell_value_text,
+    xlrd.XL_CELL_NUMBER: _cell_value_number,
+    xlrd.XL_CELL_EMPTY: _cell_value_empty,
+    xlrd.XL_CELL_BOOLEAN: _cell_value_boolean,
+    xlrd.XL_CELL_DATE: _cell_value_date,
+    xlrd.XL_CELL_ERROR: _cell_value_error,
+}
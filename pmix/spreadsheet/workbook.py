@@ -2,35 +2,56 @@
 
 import itertools
 import copy
+import hashlib
+import io
+import os
 import os.path
+import pickle
 import argparse
 
 import xlrd
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
 import xlsxwriter
 from xlsxwriter.utility import xl_rowcol_to_cell
 
 from pmix import utils
+from pmix.__version__ import __version__
 from pmix.spreadsheet import wbformat
 from pmix.spreadsheet.worksheet import Worksheet
 from pmix.spreadsheet.cell import CellError
 
 
+# Buffer size (bytes) for reading Excel files from disk
+READ_BUFFER_SIZE = 262144
+# Where parsed workbooks are cached on disk between runs. The cache
+# is never evicted and has no size bound; deleting the directory to
+# reclaim space is always safe.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pmix")
+
+
 class Workbook:
     """Class to represent an Excel file."""
 
-    def __init__(self, filename, stripstr=True):
+    def __init__(self, filename, stripstr=True, read_only=False):
         """Initialize by storing data from spreadsheet.
 
         Args:
             filename (str): The path where to find the Excel file
             stripstr (bool): Remove trailing / leading whitespace from text?
+            read_only (bool): Load for reading only? This lowers peak
+                memory by releasing each source sheet as soon as it has
+                been copied.
         """
         self.filename = filename
         self.data = []
 
         ext = os.path.splitext(filename)[1]
         if ext in (".xls", ".xlsx"):
-            self.data = self.data_from_excel(filename, stripstr)
+            self.data = self.data_from_excel(filename, stripstr, read_only)
         else:
             msg = 'Unsupported file type. Extension: "{}"'.format(ext)
             raise TypeError(msg)
@@ -136,25 +157,129 @@ class Workbook:
             sheet.update_cell_context(self.filename)
 
     @staticmethod
-    def data_from_excel(path, stripstr=True):
-        """Get data from Excel through xlrd.
+    def data_from_excel(path, stripstr=True, read_only=False):
+        """Get data from Excel.
+
+        For .xlsx files the data is read through openpyxl in read-only
+        streaming mode when openpyxl is installed (`pip install
+        pmix[fast]`), which is much faster on large files. Otherwise,
+        and always for .xls, the data is read through xlrd.
+
+        Parsed results are cached on disk keyed by a hash of the file
+        contents, so re-loading an unchanged workbook skips xlrd
+        entirely. Set the environment variable PMIX_NO_CACHE=1 to
+        disable the cache. Entries are never evicted; delete CACHE_DIR
+        to reclaim space.
 
         Args:
             path (str): The path where to find the Excel file.
             stripstr (bool): Remove trailing / leading whitespace from text?
+            read_only (bool): If true, open the workbook on demand and
+                unload each xlrd sheet once it is copied. The source
+                sheets are then never all in memory at the same time.
 
         Returns:
             A list of worksheets, matching the source Excel file.
         """
-        result = []
-        with xlrd.open_workbook(path) as book:
-            datemode = book.datemode
-            for i in range(book.nsheets):
-                ws = book.sheet_by_index(i)
-                my_ws = Worksheet.from_sheet(ws, datemode, stripstr)
-                result.append(my_ws)
+        # Slurp the file through a large buffer. Parsing then works on
+        # bytes in memory rather than many small reads of the ZIP.
+        with open(path, "rb", buffering=READ_BUFFER_SIZE) as excel_file:
+            contents = excel_file.read()
+        cache_path = None
+        if os.environ.get("PMIX_NO_CACHE") != "1":
+            digest = hashlib.sha1(contents).hexdigest()
+            cache_name = f"{digest}-{int(stripstr)}-{__version__}.pkl"
+            cache_path = os.path.join(CACHE_DIR, cache_name)
+            cached = Workbook.load_cached_data(cache_path)
+            if cached is not None:
+                return cached
+        ext = os.path.splitext(path)[1]
+        if openpyxl is not None and ext == ".xlsx":
+            result = Workbook.data_from_openpyxl(contents, stripstr)
+        else:
+            result = []
+            with xlrd.open_workbook(
+                file_contents=contents, on_demand=read_only
+            ) as book:
+                datemode = book.datemode
+                for i in range(book.nsheets):
+                    ws = book.sheet_by_index(i)
+                    my_ws = Worksheet.from_sheet(ws, datemode, stripstr)
+                    if read_only:
+                        book.unload_sheet(i)
+                    result.append(my_ws)
+        if cache_path is not None:
+            Workbook.save_cached_data(cache_path, result)
         return result
 
+    @staticmethod
+    def data_from_openpyxl(contents, stripstr=True):
+        """Get data from an .xlsx file through openpyxl.
+
+        The workbook is streamed in read-only mode, so source sheets
+        are never fully materialized in memory.
+
+        Args:
+            contents (bytes): The contents of the .xlsx file.
+            stripstr (bool): Remove trailing / leading whitespace from text?
+
+        Returns:
+            A list of worksheets, matching the source Excel file.
+        """
+        book = openpyxl.load_workbook(
+            io.BytesIO(contents), read_only=True, data_only=True
+        )
+        try:
+            return [
+                Worksheet.from_openpyxl_sheet(sheet, stripstr)
+                for sheet in book.worksheets
+            ]
+        finally:
+            book.close()
+
+    @staticmethod
+    def load_cached_data(cache_path):
+        """Load parsed worksheet data from the on-disk cache.
+
+        Args:
+            cache_path (str): The path of the cache entry
+
+        Returns:
+            A list of worksheets, or None if there is no usable entry.
+        """
+        try:
+            with open(cache_path, "rb") as cache_file:
+                return pickle.load(cache_file)
+        except (
+            OSError,
+            pickle.PickleError,
+            EOFError,
+            AttributeError,
+            ImportError,
+        ):
+            return None
+
+    @staticmethod
+    def save_cached_data(cache_path, data):
+        """Save parsed worksheet data to the on-disk cache.
+
+        The entry is written to a temporary file and moved into place so
+        that concurrent processes never see a partial entry. Failure to
+        cache is never an error.
+
+        Args:
+            cache_path (str): The path of the cache entry
+            data (list): The parsed worksheets to store
+        """
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as cache_file:
+                pickle.dump(data, cache_file)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass
+
     def __len__(self):
         """Return the number of sheets in this workbook."""
         return len(self.data)
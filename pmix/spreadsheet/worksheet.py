@@ -41,6 +41,9 @@ class Worksheet:
             self.name = "sheet" + str(Worksheet.count)
         else:
             self.name = name
+        # The (row, col) pairs of error cells, indexed at load time.
+        # None means no index exists and a full scan is needed.
+        self.error_cells = None
 
     @property
     def dim(self):
@@ -80,6 +83,7 @@ class Worksheet:
             Worksheet: An initialized Worksheet object
         """
         worksheet = cls(name=sheet.name)
+        error_cells = []
         for i in range(sheet.nrows):
             cur_row = []
             for j, col in enumerate(sheet.row(i)):
@@ -89,8 +93,41 @@ class Worksheet:
                     xl_name = xl_rowcol_to_cell(i, j)
                     msg = f"Error sheet {sheet.name} in cell {xl_name}: {err!s}"
                     raise TypeError(msg) from err
+                if cell.is_error():
+                    error_cells.append((i, j))
+                cur_row.append(cell)
+            worksheet.data.append(cur_row)
+        worksheet.error_cells = error_cells
+        return worksheet
+
+    @classmethod
+    def from_openpyxl_sheet(cls, sheet, stripstr=True):
+        """Create Worksheet from an openpyxl read-only worksheet.
+
+        Args:
+            sheet: An openpyxl read-only worksheet to copy over
+            stripstr (bool): Remove trailing / leading whitespace from text?
+
+        Returns:
+            Worksheet: An initialized Worksheet object
+        """
+        worksheet = cls(name=sheet.title)
+        error_cells = []
+        ncol = 0
+        for i, row in enumerate(sheet.iter_rows()):
+            cur_row = []
+            for j, col in enumerate(row):
+                cell = Cell.from_openpyxl_cell(col, stripstr)
+                if cell.is_error():
+                    error_cells.append((i, j))
                 cur_row.append(cell)
+            ncol = max(ncol, len(cur_row))
             worksheet.data.append(cur_row)
+        # Keep the worksheet rectangular: openpyxl may deliver short
+        # rows when trailing cells are empty.
+        for cur_row in worksheet.data:
+            cur_row.extend(Cell() for _ in range(ncol - len(cur_row)))
+        worksheet.error_cells = error_cells
         return worksheet
 
     def append_col(self, header=None):
@@ -99,11 +136,24 @@ class Worksheet:
         Args:
             header: The optional header for the column
         """
+        self.append_cols([header])
+
+    def append_cols(self, headers):
+        """Append several columns to the end of the worksheet.
+
+        The cell context is brought into sync once at the end, rather
+        than once per appended column.
+
+        Args:
+            headers: The headers for the new columns
+        """
+        if not headers:
+            return
         for i, row in enumerate(self):
             if i == 0:
-                row.append(Cell(header))
+                row.extend(Cell(header) for header in headers)
             else:
-                row.append(Cell())
+                row.extend(Cell() for _ in headers)
         self.update_cell_context()
 
     def column_headers(self):
@@ -256,17 +306,27 @@ class Worksheet:
     def get_excel_errors(self):
         """Get all Excel errors in this worksheet.
 
+        When the error-cell index from load time is available, only the
+        indexed cells are visited, so the work is proportional to the
+        number of errors rather than the number of cells.
+
         Returns:
             A dictionary with error text as keys and values as lists of cell
             locations.
         """
+        if self.error_cells is None:
+            coordinates = (
+                (i, j) for i, row in enumerate(self) for j in range(len(row))
+            )
+        else:
+            coordinates = self.error_cells
         errors = defaultdict(list)
-        for i, row in enumerate(self):
-            for j, cell in enumerate(row):
-                if cell.is_error():
-                    error_text = cell.value.error_text
-                    location = xl_rowcol_to_cell(i, j)
-                    errors[error_text].append(location)
+        for i, j in coordinates:
+            cell = self.data[i][j]
+            if cell.is_error():
+                error_text = cell.value.error_text
+                location = xl_rowcol_to_cell(i, j)
+                errors[error_text].append(location)
         return errors
 
     def update_cell_context(self, filename: str = None):
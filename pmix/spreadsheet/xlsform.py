@@ -1,4 +1,5 @@
 """Module defining Xlsform class to work with ODK XLSForms."""
+import concurrent.futures
 from typing import List, Optional
 
 from pmix.spreadsheet.xlstab import Xlstab
@@ -15,53 +16,69 @@ class Xlsform(Workbook):
     Note: Analogously, the Xlstab class extends the Worksheet class.
     """
 
-    def __init__(self, path: str, stripstr: bool = True):
+    def __init__(
+        self, path: str, stripstr: bool = True, read_only: bool = False
+    ):
         """Initialize workbook and cache Xlsform-specific info.
 
         Args:
             path: The path where to find the Xlsform file.
             stripstr: Remove trailing / leading whitespace from text?
+            read_only: Load for reading only? See Workbook.
         """
-        super().__init__(path, stripstr)
+        super().__init__(path, stripstr, read_only)
         self.data = [Xlstab.from_worksheet(ws) for ws in self]
-        self.settings = {}
-        self.init_settings()
+        self._settings = None
+
+    @property
+    def settings(self) -> dict:
+        """Return the Xlsform's settings, computed on first access.
 
-    def init_settings(self):
+        The settings sheet is scanned once and the result is cached.
+        Call `refresh_settings` after modifying the settings sheet.
+        """
+        if self._settings is None:
+            self._settings = self.init_settings()
+        return self._settings
+
+    def init_settings(self) -> dict:
         """Get settings from Xlsform.
 
-        Post-condition: the Xlsform's settings are stored in the instance.
+        Returns:
+            A dictionary of the settings, or an empty dictionary if
+            there is no usable settings sheet.
         """
         try:
             local_settings = self["settings"]
             headers = local_settings[0]
             values = local_settings[1]
-            self.settings = {
+            return {
                 str(k): str(v)
                 for k, v in zip(headers, values)
                 if not k.is_blank() and not v.is_blank()
             }
         except (KeyError, IndexError):
-            self.settings = {}
+            return {}
+
+    def refresh_settings(self):
+        """Drop the cached settings so the next access recomputes them."""
+        self._settings = None
 
     @property
     def form_id(self) -> str:
         """Return form_id setting value."""
-        self.init_settings()
         form_id = self.settings["form_id"]
         return form_id
 
     @property
     def form_title(self) -> str:
         """Return form_title setting value."""
-        self.init_settings()
         form_title = self.settings["form_title"]
         return form_title
 
     @property
     def settings_language(self) -> Optional[str]:
         """Return default language from settings or None if not found."""
-        self.init_settings()
         default_language = self.settings.get("default_language", None)
         return default_language
 
@@ -101,17 +118,22 @@ class Xlsform(Workbook):
     def add_languages(self, languages: List[str]):
         """Add appropriate language columns to an Xlsform.
 
+        Each sheet appends all of its new columns in one pass.
+
         Args:
             languages: The languages to add to all relevant sheets.
         """
-        for language in languages:
-            self.add_language(language)
+        for sheet in self:
+            sheet.add_languages(languages)
 
     def merge_translations(
         self, translations, ignore=None, carry=False, no_diverse=False
     ):
         """Merge translations.
 
+        Sheets are independent of each other, so with multiple sheets
+        the merging overlaps across a small thread pool.
+
         Args:
             translations (TranslationDict): Translations
             ignore (set of str): The languages to ignore when translating
@@ -119,7 +141,25 @@ class Xlsform(Workbook):
             no_diverse (bool): If true, then do not translate text that has
                 multiple translations.
         """
-        for sheet in self:
-            sheet.merge_translations(
-                translations, ignore, carry=carry, no_diverse=no_diverse
-            )
+        if len(self.data) > 1:
+            max_workers = min(8, len(self.data))
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        sheet.merge_translations,
+                        translations,
+                        ignore,
+                        carry=carry,
+                        no_diverse=no_diverse,
+                    )
+                    for sheet in self
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for sheet in self:
+                sheet.merge_translations(
+                    translations, ignore, carry=carry, no_diverse=no_diverse
+                )
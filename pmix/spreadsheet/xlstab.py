@@ -75,6 +75,7 @@ class Xlstab(Worksheet):
     def from_worksheet(cls, worksheet):
         """Create an instance of Xlstab from a Worksheet instance."""
         xlstab = cls(data=worksheet.data, name=worksheet.name)
+        xlstab.error_cells = worksheet.error_cells
         return xlstab
 
     def label_columns(self, *, indices_only: bool = False):
@@ -118,8 +119,16 @@ class Xlstab(Worksheet):
         Args:
             language: The language to add
         """
-        if language is None:
-            return
+        self.add_languages([language])
+
+    def add_languages(self, languages):
+        """Add the used translatable columns in the given languages.
+
+        All new columns are appended in a single pass over the sheet.
+
+        Args:
+            languages: The languages to add
+        """
         translate_columns = ()
         if self.name == "survey":
             translate_columns = self.SURVEY_TRANSLATIONS
@@ -130,9 +139,13 @@ class Xlstab(Worksheet):
         for col in translate_columns:
             if any(h.startswith(col) for h in headers):
                 to_translate.append(col)
-        for col in to_translate:
-            header = "{}::{}".format(col, language)
-            self.append_col(header)
+        new_headers = []
+        for language in languages:
+            if language is None:
+                continue
+            for col in to_translate:
+                new_headers.append("{}::{}".format(col, language))
+        self.append_cols(new_headers)
 
     def translation_pairs(self, ignore=None, base="English"):
         """DEPRECATED: Iterate through translation pairs in this tab.
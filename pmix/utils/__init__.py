@@ -1,5 +1,6 @@
 """Useful string functions for PMIX."""
 from collections import namedtuple
+import functools
 import re
 import string
 
@@ -31,8 +32,39 @@ NUMBER_DELIMITER = (".", ":", ")")
 VALID_NUMBER_ALPHABET = tuple(string.ascii_letters + string.digits + "._-")
 
 
+PROPER_NUMBER_RE = r"""
+                   [a-zA-Z][.:)]        # A single letter with delimiter
+                   |
+                   (?=.*\d)             # Must contain a digit, and
+                   [a-zA-Z0-9]          # start with a letter or digit,
+                   (?:
+                       [a-zA-Z0-9._-]*  # then letters, digits, . _ -
+                       [a-zA-Z0-9]      # ending with a letter or digit,
+                   )?
+                   [.:)]                # and always a delimiter last
+                   """
+
+
+PROPER_NUMBER_PROG = re.compile(PROPER_NUMBER_RE, re.VERBOSE)
+
+
+# A carriage return, possibly as part of a Windows newline
+CARRIAGE_RETURN_PROG = re.compile(r"\r\n?")
+# Spaces around a newline, or a run of several spaces
+WHITESPACE_FIX_PROG = re.compile(r" *\n *| {2,}")
+# Whitespace to unicode: middle dot, small right triangle, downwards
+# arrow with corner leftwards
+SHOW_WHITESPACE_TABLE = str.maketrans(
+    {" ": "·", "\t": "▸", "\n": "↵"}
+)
+
+
+@functools.lru_cache(maxsize=131072)
 def split_numbered_text(text: str) -> NumberLabelSplit:
-    """Split a question text into components."""
+    """Split a question text into components.
+
+    Question text repeats heavily across a form, so results are cached.
+    """
     stripped = text.strip()
     this_split = stripped.split(maxsplit=1)
     if not this_split:
@@ -46,22 +78,15 @@ def split_numbered_text(text: str) -> NumberLabelSplit:
     return NumberLabelSplit("", "", "", stripped)
 
 
+@functools.lru_cache(maxsize=65536)
 def is_proper_number(text: str):
-    """Test if a number is a proper number."""
-    if len(text) < 2:
-        return False
-    ends_with = [".", ":", ")"]
-    proper_ending = any(text.endswith(ending) for ending in ends_with)
-    if not proper_ending:
-        return False
-    if len(text) == 2 and text[0] in string.ascii_letters:
-        return True
-    number, _ = text[:-1], text[-1]
-    has_digit = any(i.isdigit() for i in number)
-    all_valid_characters = all(i in VALID_NUMBER_ALPHABET for i in number)
-    first_valid = number[0] in string.ascii_letters + string.digits
-    last_valid = number[-1] in string.ascii_letters + string.digits
-    return has_digit and all_valid_characters and first_valid and last_valid
+    """Test if a number is a proper number.
+
+    A single full match of `PROPER_NUMBER_PROG` checks the delimiter,
+    the allowed alphabet, the digit requirement, and the endpoints of
+    the number all in one pass.
+    """
+    return bool(PROPER_NUMBER_PROG.fullmatch(text))
 
 
 def td_clean_string(text):
@@ -115,12 +140,10 @@ def clean_string(text):
     Returns:
         A cleaned string with number removed.
     """
-    text = text.strip()
-    text = text.replace("\r\n", "\n")
-    text = text.replace("\r", "\n")
-    text = space_newline_fix(text)
-    text = newline_space_fix(text)
-    text = space_space_fix(text)
+    text = CARRIAGE_RETURN_PROG.sub("\n", text.strip())
+    text = WHITESPACE_FIX_PROG.sub(
+        lambda match: "\n" if "\n" in match.group() else " ", text
+    )
     return text
 
 
@@ -184,12 +207,5 @@ def show_whitespace(text):
     Returns:
         The text with the whitespace now visible.
     """
-    text = text.replace("\r\n", "\n")
-    text = text.replace("\r", "\n")
-    # Middle dot
-    text = text.replace(" ", "\u00b7")
-    # Small right triangle
-    text = text.replace("\t", "\u25b8")
-    # Downwards arrow with corner leftwards
-    text = text.replace("\n", "\u21b5")
-    return text
+    text = CARRIAGE_RETURN_PROG.sub("\n", text)
+    return text.translate(SHOW_WHITESPACE_TABLE)
@@ -3,6 +3,11 @@ import logging
 
 import xlsxwriter
 
+try:
+    import pyexcelerate
+except ImportError:
+    pyexcelerate = None
+
 from pmix import utils
 from pmix import Workbook
 from pmix import Xlsform
@@ -281,6 +286,44 @@ class TranslationDict:
         numbered_translation = number + clean_translation
         return numbered_translation
 
+    def merge(self, other):
+        """Merge another TranslationDict into this one, keeping correctness.
+
+        In contrast to `update`, this method honors the `correct` markings
+        of both dictionaries: translations for a source text that is
+        marked correct in either dictionary displace translations that
+        are not marked correct. It is intended for combining per-file
+        dictionaries extracted independently, e.g. in worker processes.
+
+        Args:
+            other: TranslationDict to consume
+
+        Raises:
+            TypeError: If `other` is not a TranslationDict
+        """
+        if not isinstance(other, TranslationDict):
+            raise TypeError(other)
+        for src in other:
+            correct = src in other.correct
+            if not correct and src in self.correct:
+                # Currently not a correct translation, but we have correct
+                continue
+            if correct and src not in self.correct and src in self.data:
+                # Remove the old, non-correct translations
+                self.data.pop(src, None)
+            if correct:
+                self.correct.add(src)
+            try:
+                this_dict = self.data[src]
+                other_dict = other[src]
+                for lang in other_dict:
+                    if lang in this_dict:
+                        this_dict[lang].extend(other_dict[lang])
+                    else:
+                        this_dict[lang] = other_dict[lang]
+            except KeyError:
+                self.data[src] = other[src]
+
     def update(self, other):
         """Merge another TranslationDict into this one.
 
@@ -324,14 +367,15 @@ class TranslationDict:
         An MS-Excel spreadsheet can easily handle unicode and entries with
         newlines. It also supports coloring to highlight missing data.
 
+        If the optional pyexcelerate package is installed, it is used for
+        writing since it is several times faster than xlsxwriter on a
+        plain grid of strings. Otherwise, xlsxwriter is used and rows
+        stream from the dictionary to disk one at a time.
+
         Args:
             path (str): String path to write the MS-Excel file
             others (list): Other languages to add to the output.
         """
-        wb = xlsxwriter.Workbook(path)
-        red_background = wb.add_format()
-        red_background.set_bg_color("#FFAAA5")
-        ws = wb.add_worksheet("translations")
         other_languages = sorted(list(self.get_languages()))
         all_languages = [self.base] + other_languages
         if others:
@@ -339,18 +383,87 @@ class TranslationDict:
                 if other not in all_languages:
                     all_languages.append(other)
         header_row = ["text::{}".format(lang) for lang in all_languages]
-        ws.write_row(0, 0, header_row)
-        for i, k in enumerate(self.data):
-            ws.write(i + 1, 0, k)
+        rows = self.translation_rows(other_languages)
+        if pyexcelerate is not None:
+            self._write_rows_pyexcelerate(path, header_row, rows)
+        else:
+            self._write_rows_xlsxwriter(path, header_row, rows)
+
+    def translation_rows(self, other_languages):
+        """Generate the output rows for a translation file lazily.
+
+        Args:
+            other_languages (list): The non-base languages, in column order
+
+        Yields:
+            A tuple `(row, missing)` per source string. `row` is the list
+            of strings for the output row, base language first. `missing`
+            is a list of column indices in `row` with no translation.
+        """
+        for k in self.data:
+            row = [k]
+            missing = []
             for j, lang in enumerate(other_languages):
                 try:
-                    translation = self.get_translation(k, lang)
-                    ws.write(i + 1, j + 1, translation)
+                    row.append(self.get_translation(k, lang))
                 except KeyError:
                     # Missing information is highlighted
-                    ws.write(i + 1, j + 1, "", red_background)
+                    row.append("")
+                    missing.append(j + 1)
+            yield row, missing
+
+    @staticmethod
+    def _write_rows_xlsxwriter(path, header_row, rows):
+        """Stream translation rows to disk with xlsxwriter.
+
+        Rows flow from the generator to the constant-memory writer one at
+        a time, so only the row being written is held in memory.
+
+        Args:
+            path (str): String path to write the MS-Excel file
+            header_row (list): The header strings
+            rows: Iterable of `(row, missing)` pairs, as produced by
+                `translation_rows`
+        """
+        wb = xlsxwriter.Workbook(path, {"constant_memory": True})
+        red_background = wb.add_format()
+        red_background.set_bg_color("#FFAAA5")
+        ws = wb.add_worksheet("translations")
+        ws.write_row(0, 0, header_row)
+        for i, (row, missing) in enumerate(rows, start=1):
+            for j, value in enumerate(row):
+                if j in missing:
+                    ws.write(i, j, value, red_background)
+                else:
+                    ws.write(i, j, value)
         wb.close()
 
+    @staticmethod
+    def _write_rows_pyexcelerate(path, header_row, rows):
+        """Write translation rows with pyexcelerate.
+
+        Args:
+            path (str): String path to write the MS-Excel file
+            header_row (list): The header strings
+            rows: Iterable of `(row, missing)` pairs, as produced by
+                `translation_rows`
+        """
+        grid = [header_row]
+        missing_cells = []
+        for i, (row, missing) in enumerate(rows, start=1):
+            grid.append(row)
+            missing_cells.extend((i, j) for j in missing)
+        wb = pyexcelerate.Workbook()
+        ws = wb.new_sheet("translations", data=grid)
+        red_fill = pyexcelerate.Fill(
+            background=pyexcelerate.Color(255, 170, 165)
+        )
+        red_background = pyexcelerate.Style(fill=red_fill)
+        for row, col in missing_cells:
+            # pyexcelerate cell addressing is 1-indexed
+            ws.set_cell_style(row + 1, col + 1, red_background)
+        wb.save(path)
+
     # pylint: disable=too-many-locals
     def write_diverse_excel(self, path, language):
         """Write translation duplicate data to an Excel spreadsheet.
@@ -359,7 +472,7 @@ class TranslationDict:
             path (str): String path to write the MS-Excel file
             language (str): The language to find duplicates
         """
-        wb = xlsxwriter.Workbook(path)
+        wb = xlsxwriter.Workbook(path, {"constant_memory": True})
         red_background = wb.add_format()
         red_background.set_bg_color("#FFAAA5")
         ws = wb.add_worksheet("translations")
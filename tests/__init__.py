@@ -1,3 +1,12 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Tests for the package."""
+"""Tests for the package.
+
+The on-disk workbook cache is disabled for the whole suite so that
+tests always exercise the parsing code and never read stale parses
+from, or write into, the developer's cache directory. Tests that
+cover the cache itself re-enable it against a temporary directory.
+"""
+import os
+
+os.environ["PMIX_NO_CACHE"] = "1"
@@ -20,6 +20,8 @@
 import unittest
 
 import pmix.utils as utils
+from pmix.spreadsheet.cell import Cell
+from pmix.verbiage import TranslationDict
 
 
 class TranslationDictNumberSplitTest(unittest.TestCase):
@@ -71,5 +73,72 @@ class TranslationDictNumberSplitTest(unittest.TestCase):
             self.assertTrue(number == "", msg=msg)
 
 
+class TranslationDictMergeTest(unittest.TestCase):
+    """Unit tests for TranslationDict.merge."""
+
+    @staticmethod
+    def make_dict(translations, correct=False):
+        """Create a TranslationDict with the given translations.
+
+        Args:
+            translations: Tuples of (source text, language, translation)
+            correct (bool): Mark the translations as correct?
+        """
+        translation_dict = TranslationDict()
+        for src, lang, translation in translations:
+            other = {"cell": Cell(translation)}
+            translation_dict.add_translation(src, other, lang, correct)
+        return translation_dict
+
+    def test_correct_displaces_noncorrect(self):
+        """Test that correct translations displace non-correct ones."""
+        first = self.make_dict([("Hello", "French", "Salut")])
+        second = self.make_dict(
+            [("Hello", "French", "Bonjour")], correct=True
+        )
+        first.merge(second)
+        found = first.get_unique_translations("Hello", "French")
+        self.assertEqual(found, ["Bonjour"])
+        self.assertIn("Hello", first.correct)
+
+    def test_noncorrect_does_not_displace_correct(self):
+        """Test that non-correct translations never displace correct."""
+        first = self.make_dict([("Hello", "French", "Bonjour")], correct=True)
+        second = self.make_dict([("Hello", "French", "Salut")])
+        first.merge(second)
+        found = first.get_unique_translations("Hello", "French")
+        self.assertEqual(found, ["Bonjour"])
+
+    def test_correct_in_both(self):
+        """Test that correct translations from both sides are kept."""
+        first = self.make_dict([("Hello", "French", "Bonjour")], correct=True)
+        second = self.make_dict([("Hello", "French", "Salut")], correct=True)
+        first.merge(second)
+        found = first.get_unique_translations("Hello", "French")
+        self.assertEqual(found, ["Bonjour", "Salut"])
+        self.assertIn("Hello", first.correct)
+
+    def test_merge_preserves_order(self):
+        """Test that merged translations keep first-seen order on ties."""
+        first = self.make_dict([("Hello", "French", "Bonjour")])
+        second = self.make_dict([("Hello", "French", "Salut")])
+        first.merge(second)
+        self.assertEqual(first.get_translation("Hello", "French"), "Bonjour")
+
+    def test_merge_aggregates_counts(self):
+        """Test that translation counts accumulate across a merge."""
+        first = self.make_dict(
+            [("Hello", "French", "Bonjour"), ("Hello", "French", "Salut")]
+        )
+        second = self.make_dict([("Hello", "French", "Salut")])
+        first.merge(second)
+        self.assertEqual(first.get_translation("Hello", "French"), "Salut")
+
+    def test_merge_wrong_type(self):
+        """Test that merging a non-TranslationDict raises TypeError."""
+        with self.assertRaises(TypeError):
+            TranslationDict().merge({})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,15 @@
 """Tests for Workbook module."""
+import datetime
+import os
 import os.path
+import shutil
+import tempfile
 import unittest
 
+import xlsxwriter
+
 from pmix import Workbook
+from pmix.spreadsheet import workbook as workbook_module
 
 
 class ExcelErrorDetectionTest(unittest.TestCase):
@@ -27,3 +34,152 @@ class ExcelErrorDetectionTest(unittest.TestCase):
             found_unclean = wb.get_excel_errors()
             found = {k: dict(v) for k, v in found_unclean.items()}
             self.assertEqual(answer, found)
+
+
+@unittest.skipIf(
+    workbook_module.openpyxl is None, "openpyxl is not installed"
+)
+class ReaderEquivalenceTest(unittest.TestCase):
+    """Compare workbooks loaded through openpyxl and through xlrd."""
+
+    FORM_DIR = "tests/static"
+
+    def setUp(self):
+        """Create a workbook with one cell of each value type."""
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "types.xlsx")
+        book = xlsxwriter.Workbook(self.path)
+        sheet = book.add_worksheet("types")
+        date_format = book.add_format({"num_format": "yyyy-mm-dd"})
+        datetime_format = book.add_format(
+            {"num_format": "yyyy-mm-dd hh:mm:ss"}
+        )
+        time_format = book.add_format({"num_format": "hh:mm:ss"})
+        sheet.write_datetime(0, 0, datetime.date(1999, 12, 31), date_format)
+        sheet.write_datetime(
+            0, 1, datetime.datetime(2020, 5, 17, 13, 45, 30), datetime_format
+        )
+        sheet.write_datetime(0, 2, datetime.time(6, 30, 15), time_format)
+        sheet.write(0, 3, "text")
+        sheet.write(0, 4, 3.5)
+        sheet.write(0, 5, 42)
+        sheet.write(0, 6, True)
+        book.close()
+        self.saved_no_cache = os.environ.get("PMIX_NO_CACHE")
+        os.environ["PMIX_NO_CACHE"] = "1"
+
+    def tearDown(self):
+        """Remove temporary files and restore the cache setting."""
+        shutil.rmtree(self.tmpdir)
+        if self.saved_no_cache is None:
+            del os.environ["PMIX_NO_CACHE"]
+        else:
+            os.environ["PMIX_NO_CACHE"] = self.saved_no_cache
+
+    @staticmethod
+    def load_with_xlrd(path):
+        """Load a workbook with the openpyxl reader disabled."""
+        saved = workbook_module.openpyxl
+        workbook_module.openpyxl = None
+        try:
+            return Workbook(path)
+        finally:
+            workbook_module.openpyxl = saved
+
+    def test_same_cells(self):
+        """Test that both readers produce identical cells."""
+        via_openpyxl = Workbook(self.path)
+        via_xlrd = self.load_with_xlrd(self.path)
+        self.assertEqual(via_openpyxl.sheetnames(), via_xlrd.sheetnames())
+        for one, two in zip(via_openpyxl, via_xlrd):
+            self.assertEqual(one.dim, two.dim)
+            for row_one, row_two in zip(one, two):
+                for cell_one, cell_two in zip(row_one, row_two):
+                    self.assertEqual(cell_one.value, cell_two.value)
+                    self.assertIs(
+                        type(cell_one.value), type(cell_two.value)
+                    )
+
+    def test_same_errors(self):
+        """Test that both readers report the same Excel errors."""
+        path = os.path.join(self.FORM_DIR, "error-basic.xlsx")
+        via_openpyxl = Workbook(path)
+        via_xlrd = self.load_with_xlrd(path)
+        self.assertEqual(
+            via_openpyxl.get_excel_errors(), via_xlrd.get_excel_errors()
+        )
+
+
+class WorkbookDiskCacheTest(unittest.TestCase):
+    """Tests for the on-disk workbook cache."""
+
+    FORM_DIR = "tests/static"
+
+    def setUp(self):
+        """Point the cache at a temporary directory and enable it."""
+        self.tmpdir = tempfile.mkdtemp()
+        self.saved_cache_dir = workbook_module.CACHE_DIR
+        workbook_module.CACHE_DIR = os.path.join(self.tmpdir, "cache")
+        self.saved_no_cache = os.environ.pop("PMIX_NO_CACHE", None)
+
+    def tearDown(self):
+        """Restore the cache settings and remove temporary files."""
+        workbook_module.CACHE_DIR = self.saved_cache_dir
+        shutil.rmtree(self.tmpdir)
+        if self.saved_no_cache is not None:
+            os.environ["PMIX_NO_CACHE"] = self.saved_no_cache
+
+    @staticmethod
+    def cache_entries():
+        """List the current cache entries."""
+        if not os.path.isdir(workbook_module.CACHE_DIR):
+            return []
+        return os.listdir(workbook_module.CACHE_DIR)
+
+    def test_round_trip(self):
+        """Test that a cached workbook loads back identically."""
+        path = os.path.join(self.FORM_DIR, "error-basic.xlsx")
+        first = Workbook(path)
+        self.assertEqual(len(self.cache_entries()), 1)
+        second = Workbook(path)
+        self.assertEqual(len(self.cache_entries()), 1)
+        self.assertEqual(first.sheetnames(), second.sheetnames())
+        for one, two in zip(first, second):
+            self.assertEqual(one.dim, two.dim)
+            for row_one, row_two in zip(one, two):
+                for cell_one, cell_two in zip(row_one, row_two):
+                    self.assertEqual(str(cell_one), str(cell_two))
+        self.assertEqual(first.get_excel_errors(), second.get_excel_errors())
+
+    def test_changed_content_misses(self):
+        """Test that different file content gets a different entry."""
+        one = os.path.join(self.FORM_DIR, "error-basic.xlsx")
+        two = os.path.join(self.FORM_DIR, "language-default-none.xlsx")
+        Workbook(one)
+        Workbook(two)
+        self.assertEqual(len(self.cache_entries()), 2)
+
+    def test_disabled_by_environment(self):
+        """Test that PMIX_NO_CACHE=1 bypasses the cache."""
+        os.environ["PMIX_NO_CACHE"] = "1"
+        try:
+            path = os.path.join(self.FORM_DIR, "error-basic.xlsx")
+            Workbook(path)
+            self.assertEqual(self.cache_entries(), [])
+        finally:
+            del os.environ["PMIX_NO_CACHE"]
+
+    def test_corrupt_entry_ignored(self):
+        """Test that a corrupt cache entry falls back to parsing."""
+        path = os.path.join(self.FORM_DIR, "error-basic.xlsx")
+        Workbook(path)
+        entry = self.cache_entries()[0]
+        entry_path = os.path.join(workbook_module.CACHE_DIR, entry)
+        with open(entry_path, "wb") as cache_file:
+            cache_file.write(b"not a pickle")
+        reloaded = Workbook(path)
+        self.assertEqual(reloaded.sheetnames(), ("Sheet1",))
+
+
+if __name__ == "__main__":
+    unittest.main()